@@ -66,6 +66,7 @@ DEFAULT_CONFIG = {
         "enable": False,
         "provider_id": "",
         "dual_output": False,
+        "max_concurrency": 3,
     },
     "provider_ltm_settings": {
         "group_icl_enable": False,
@@ -1175,6 +1176,11 @@ CONFIG_METADATA_2 = {
                         "hint": "启用后，Bot 将同时输出语音和文字消息。",
                         "obvious_hint": True,
                     },
+                    "max_concurrency": {
+                        "description": "TTS 最大并发请求数",
+                        "type": "int",
+                        "hint": "分段回复时，多个消息段会并发请求 TTS，此项限制同时进行的 TTS 请求数量。",
+                    },
                 },
             },
             "provider_ltm_settings": {
@@ -1,5 +1,8 @@
+import os
 import time
 import re
+import asyncio
+from collections import OrderedDict
 import traceback
 from typing import Union, AsyncGenerator
 from ..stage import Stage, register_stage, registered_stages
@@ -13,6 +16,9 @@ from astrbot.core import html_renderer
 from astrbot.core.star.star_handler import star_handlers_registry, EventType
 from astrbot.core.star.star import star_map
 
+# TTS 音频缓存的最大条目数
+TTS_CACHE_MAX_SIZE = 128
+
 
 @register_stage
 class ResultDecorateStage(Stage):
@@ -55,6 +61,30 @@ class ResultDecorateStage(Stage):
         self.content_cleanup_rule = ctx.astrbot_config["platform_settings"][
             "segmented_reply"
         ]["content_cleanup_rule"]
+        # 预编译分段回复的正则，避免每条消息都重新解析
+        if self.enable_segmented_reply:
+            try:
+                self.split_pattern = re.compile(self.regex, re.DOTALL | re.MULTILINE)
+                self.content_cleanup_pattern = (
+                    re.compile(self.content_cleanup_rule)
+                    if self.content_cleanup_rule
+                    else None
+                )
+            except re.error as e:
+                logger.error(f"分段回复正则表达式有误，已禁用分段回复: {e}")
+                self.enable_segmented_reply = False
+
+        # TTS 并发
+        try:
+            tts_max_concurrency = int(
+                ctx.astrbot_config["provider_tts_settings"].get("max_concurrency", 3)
+            )
+        except (TypeError, ValueError):
+            tts_max_concurrency = 3
+        self.tts_semaphore = asyncio.Semaphore(max(tts_max_concurrency, 1))
+        # 相同文本的 TTS 结果缓存（文本 -> 音频路径），切换 TTS 提供商时清空
+        self.tts_cache: OrderedDict[str, str] = OrderedDict()
+        self.tts_cache_provider = None
 
         # exception
         self.content_safe_check_reply = ctx.astrbot_config["content_safety"][
@@ -66,6 +96,56 @@ class ResultDecorateStage(Stage):
                 if stage.__class__.__name__ == "ContentSafetyCheckStage":
                     self.content_safe_check_stage = stage
 
+    def _get_cached_audio(self, tts_provider, text: str) -> str | None:
+        """获取缓存的 TTS 音频路径，音频文件已不存在时视为未命中"""
+        if tts_provider is not self.tts_cache_provider:
+            self.tts_cache.clear()
+            self.tts_cache_provider = tts_provider
+            return None
+        audio_path = self.tts_cache.get(text)
+        if audio_path is None:
+            return None
+        if not os.path.exists(audio_path):
+            del self.tts_cache[text]
+            return None
+        self.tts_cache.move_to_end(text)
+        return audio_path
+
+    def _set_cached_audio(self, tts_provider, text: str, audio_path: str):
+        if tts_provider is not self.tts_cache_provider:
+            return
+        self.tts_cache[text] = audio_path
+        self.tts_cache.move_to_end(text)
+        while len(self.tts_cache) > TTS_CACHE_MAX_SIZE:
+            self.tts_cache.popitem(last=False)
+
+    async def _tts_segment(self, tts_provider, comp) -> list:
+        """将单个消息段转为语音，返回用于替换该消息段的消息段列表"""
+        if not isinstance(comp, Plain) or len(comp.text) <= 1:
+            return [comp]
+        try:
+            logger.info("TTS 请求: " + comp.text)
+            audio_path = self._get_cached_audio(tts_provider, comp.text)
+            if audio_path:
+                logger.info("TTS 命中缓存: " + audio_path)
+            else:
+                async with self.tts_semaphore:
+                    audio_path = await tts_provider.get_audio(comp.text)
+                logger.info("TTS 结果: " + audio_path)
+                if audio_path:
+                    self._set_cached_audio(tts_provider, comp.text, audio_path)
+            if audio_path:
+                segment = [Record(file=audio_path, url=audio_path)]
+                if self.ctx.astrbot_config["provider_tts_settings"]["dual_output"]:
+                    segment.append(comp)
+                return segment
+            logger.error(f"由于 TTS 音频文件没找到，消息段转语音失败: {comp.text}")
+            return [comp]
+        except BaseException:
+            logger.error(traceback.format_exc())
+            logger.error("TTS 失败，使用文本发送。")
+            return [comp]
+
     async def process(
         self, event: AstrMessageEvent
     ) -> Union[None, AsyncGenerator[None, None]]:
@@ -151,15 +231,13 @@ class ResultDecorateStage(Stage):
                                 # 不分段回复
                                 new_chain.append(comp)
                                 continue
-                            split_response = re.findall(
-                                self.regex, comp.text, re.DOTALL | re.MULTILINE
-                            )
+                            split_response = self.split_pattern.findall(comp.text)
                             if not split_response:
                                 new_chain.append(comp)
                                 continue
                             for seg in split_response:
-                                if self.content_cleanup_rule:
-                                    seg = re.sub(self.content_cleanup_rule, "", seg)
+                                if self.content_cleanup_pattern:
+                                    seg = self.content_cleanup_pattern.sub("", seg)
                                 if seg.strip():
                                     new_chain.append(Plain(seg))
                         else:
@@ -173,31 +251,11 @@ class ResultDecorateStage(Stage):
                 and result.is_llm_result()
             ):
                 tts_provider = self.ctx.plugin_manager.context.provider_manager.curr_tts_provider_inst
-                new_chain = []
-                for comp in result.chain:
-                    if isinstance(comp, Plain) and len(comp.text) > 1:
-                        try:
-                            logger.info("TTS 请求: " + comp.text)
-                            audio_path = await tts_provider.get_audio(comp.text)
-                            logger.info("TTS 结果: " + audio_path)
-                            if audio_path:
-                                new_chain.append(
-                                    Record(file=audio_path, url=audio_path)
-                                )
-                                if(self.ctx.astrbot_config["provider_tts_settings"]["dual_output"]):
-                                    new_chain.append(comp)
-                            else:
-                                logger.error(
-                                    f"由于 TTS 音频文件没找到，消息段转语音失败: {comp.text}"
-                                )
-                                new_chain.append(comp)
-                        except BaseException:
-                            logger.error(traceback.format_exc())
-                            logger.error("TTS 失败，使用文本发送。")
-                            new_chain.append(comp)
-                    else:
-                        new_chain.append(comp)
-                result.chain = new_chain
+                # 各消息段并发请求 TTS，按原顺序组装结果
+                segments = await asyncio.gather(
+                    *[self._tts_segment(tts_provider, comp) for comp in result.chain]
+                )
+                result.chain = [comp for segment in segments for comp in segment]
 
             # 文本转图片
             elif (
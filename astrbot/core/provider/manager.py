@@ -379,7 +379,7 @@ class ProviderManager:
             del self.inst_map[provider_id]
 
     async def terminate(self):
-        for provider_inst in self.provider_insts:
+        for provider_inst in self.inst_map.values():
             if hasattr(provider_inst, "terminate"):
                 await provider_inst.terminate()
         # 清理 MCP Client 连接
@@ -27,15 +27,20 @@ class ProviderDashscopeTTSAPI(TTSProvider):
 
     async def get_audio(self, text: str) -> str:
         temp_dir = os.path.join(get_astrbot_data_path(), "temp")
-        path = os.path.join(temp_dir, f"dashscope_tts_{uuid.uuid4()}.wav")
-        self.synthesizer = SpeechSynthesizer(
+        path = os.path.join(temp_dir, f"dashscope_tts_{uuid.uuid4().hex}.wav")
+        # 每次请求使用独立的合成器，以支持并发请求
+        synthesizer = SpeechSynthesizer(
             model=self.get_model(),
             voice=self.voice,
             format=AudioFormat.WAV_24000HZ_MONO_16BIT,
         )
-        audio = await asyncio.get_event_loop().run_in_executor(
-            None, self.synthesizer.call, text, self.timeout_ms
+        await asyncio.get_event_loop().run_in_executor(
+            None, self._synthesize_to_file, synthesizer, text, path
         )
+        return path
+
+    def _synthesize_to_file(self, synthesizer, text: str, path: str):
+        """在线程池中完成合成与写盘，避免阻塞事件循环"""
+        audio = synthesizer.call(text, self.timeout_ms)
         with open(path, "wb") as f:
             f.write(audio)
-        return path
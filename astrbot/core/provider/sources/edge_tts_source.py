@@ -3,6 +3,7 @@ import os
 import edge_tts
 import subprocess
 import asyncio
+from pathlib import Path
 from ..provider import TTSProvider
 from ..entities import ProviderType
 from ..register import register_provider_adapter
@@ -38,31 +39,41 @@ class ProviderEdgeTTS(TTSProvider):
 
         self.proxy = os.getenv("https_proxy", None)
 
+        # 除文本外的 Edge TTS 参数在实例生命周期内不变，预先构建
+        self.communicate_kwargs = {"voice": self.voice, "proxy": self.proxy}
+        if self.rate:
+            self.communicate_kwargs["rate"] = self.rate
+        if self.volume:
+            self.communicate_kwargs["volume"] = self.volume
+        if self.pitch:
+            self.communicate_kwargs["pitch"] = self.pitch
+
         self.set_model("edge_tts")
 
+    @staticmethod
+    def _remove_temp_file(path: str):
+        """删除临时文件，文件不存在时忽略"""
+        try:
+            Path(path).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"删除临时文件 {path} 失败: {e}")
+
     async def get_audio(self, text: str) -> str:
         temp_dir = os.path.join(get_astrbot_data_path(), "temp")
-        mp3_path = os.path.join(temp_dir, f"edge_tts_temp_{uuid.uuid4()}.mp3")
-        wav_path = os.path.join(temp_dir, f"edge_tts_{uuid.uuid4()}.wav")
-
-        # 构建 Edge TTS 参数
-        kwargs = {"text": text, "voice": self.voice}
-        if self.rate:
-            kwargs["rate"] = self.rate
-        if self.volume:
-            kwargs["volume"] = self.volume
-        if self.pitch:
-            kwargs["pitch"] = self.pitch
+        file_id = uuid.uuid4().hex
+        mp3_path = os.path.join(temp_dir, f"edge_tts_temp_{file_id}.mp3")
+        wav_path = os.path.join(temp_dir, f"edge_tts_{file_id}.wav")
 
         try:
-            communicate = edge_tts.Communicate(proxy=self.proxy, **kwargs)
+            communicate = edge_tts.Communicate(text, **self.communicate_kwargs)
             await communicate.save(mp3_path)
 
             try:
                 from pyffmpeg import FFmpeg
 
                 ff = FFmpeg()
-                ff.convert(input=mp3_path, output=wav_path)
+                # pyffmpeg 的转换是同步阻塞的，放到线程中执行以免阻塞事件循环
+                await asyncio.to_thread(ff.convert, input=mp3_path, output=wav_path)
             except Exception as e:
                 logger.debug(f"pyffmpeg 转换失败: {e}, 尝试使用 ffmpeg 命令行进行转换")
                 # use ffmpeg command line
@@ -94,7 +105,7 @@ class ProviderEdgeTTS(TTSProvider):
                 logger.debug(f"FFmpeg错误输出: {stderr.decode().strip()}")
                 logger.info(f"[EdgeTTS] 返回值(0代表成功): {p.returncode}")
 
-            os.remove(mp3_path)
+            self._remove_temp_file(mp3_path)
             if os.path.exists(wav_path) and os.path.getsize(wav_path) > 0:
                 return wav_path
             else:
@@ -105,18 +116,10 @@ class ProviderEdgeTTS(TTSProvider):
             logger.error(
                 f"FFmpeg 转换失败: {e.stderr.decode() if e.stderr else str(e)}"
             )
-            try:
-                if os.path.exists(mp3_path):
-                    os.remove(mp3_path)
-            except Exception:
-                pass
+            self._remove_temp_file(mp3_path)
             raise RuntimeError(f"FFmpeg 转换失败: {str(e)}")
 
         except Exception as e:
             logger.error(f"音频生成失败: {str(e)}")
-            try:
-                if os.path.exists(mp3_path):
-                    os.remove(mp3_path)
-            except Exception:
-                pass
+            self._remove_temp_file(mp3_path)
             raise RuntimeError(f"音频生成失败: {str(e)}")
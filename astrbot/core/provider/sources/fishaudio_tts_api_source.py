@@ -47,11 +47,18 @@ class ProviderFishAudioTTSAPI(TTSProvider):
         self.character: str = provider_config.get("fishaudio-tts-character", "可莉")
         self.api_base: str = provider_config.get(
             "api_base", "https://api.fish-audio.cn/v1"
-        )
+        ).rstrip("/")
         self.headers = {
             "Authorization": f"Bearer {self.chosen_api_key}",
         }
+        # 请求地址在实例生命周期内不变，基于已去除末尾斜杠的 api_base 预先拼接
+        self.model_url = f"{self.api_base.removesuffix('/v1')}/model"
+        self.tts_url = f"{self.api_base}/tts"
         self.set_model(provider_config.get("model", None))
+        # 复用同一个客户端，避免每次请求都重新建立连接
+        self.client = AsyncClient()
+        # 角色对应的 reference_id 缓存，避免每次合成前都查询模型列表
+        self.reference_id_cache: dict[str, str] = {}
 
     async def _get_reference_id_by_character(self, character: str) -> str:
         """
@@ -67,42 +74,51 @@ class ProviderFishAudioTTSAPI(TTSProvider):
             APIException: 获取语音角色列表为空
         """
         sort_options = ["score", "task_count", "created_at"]
-        async with AsyncClient(base_url=self.api_base.replace("/v1", "")) as client:
-            for sort_by in sort_options:
-                params = {"title": character, "sort_by": sort_by}
-                response = await client.get(
-                    "/model", params=params, headers=self.headers
-                )
-                resp_data = response.json()
-                if resp_data["total"] == 0:
-                    continue
-                for item in resp_data["items"]:
-                    if character in item["title"]:
-                        return item["_id"]
-            return None
+        for sort_by in sort_options:
+            params = {"title": character, "sort_by": sort_by}
+            response = await self.client.get(
+                self.model_url,
+                params=params,
+                headers=self.headers,
+            )
+            resp_data = response.json()
+            if resp_data["total"] == 0:
+                continue
+            for item in resp_data["items"]:
+                if character in item["title"]:
+                    return item["_id"]
+        return None
 
     async def _generate_request(self, text: str) -> dict:
+        reference_id = self.reference_id_cache.get(self.character)
+        if reference_id is None:
+            reference_id = await self._get_reference_id_by_character(self.character)
+            if reference_id is not None:
+                self.reference_id_cache[self.character] = reference_id
         return ServeTTSRequest(
             text=text,
             format="wav",
-            reference_id=await self._get_reference_id_by_character(self.character),
+            reference_id=reference_id,
         )
 
     async def get_audio(self, text: str) -> str:
         temp_dir = os.path.join(get_astrbot_data_path(), "temp")
-        path = os.path.join(temp_dir, f"fishaudio_tts_api_{uuid.uuid4()}.wav")
+        path = os.path.join(temp_dir, f"fishaudio_tts_api_{uuid.uuid4().hex}.wav")
         self.headers["content-type"] = "application/msgpack"
         request = await self._generate_request(text)
-        async with AsyncClient(base_url=self.api_base).stream(
+        async with self.client.stream(
             "POST",
-            "/tts",
+            self.tts_url,
             headers=self.headers,
             content=ormsgpack.packb(request, option=ormsgpack.OPT_SERIALIZE_PYDANTIC),
         ) as response:
             if response.headers["content-type"] == "audio/wav":
                 with open(path, "wb") as f:
-                    async for chunk in response.aiter_bytes():
+                    async for chunk in response.aiter_bytes(64 * 1024):
                         f.write(chunk)
                 return path
             text = await response.aread()
             raise Exception(f"Fish Audio API请求失败: {text}")
+
+    async def terminate(self):
+        await self.client.aclose()
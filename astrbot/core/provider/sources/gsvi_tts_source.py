@@ -23,33 +23,33 @@ class ProviderGSVITTS(TTSProvider):
             self.api_base = self.api_base[:-1]
         self.character = provider_config.get("character")
         self.emotion = provider_config.get("emotion")
+        self.tts_url = f"{self.api_base}/tts"
 
-    async def get_audio(self, text: str) -> str:
-        temp_dir = os.path.join(get_astrbot_data_path(), "temp")
-        path = os.path.join(temp_dir, f"gsvi_tts_{uuid.uuid4()}.wav")
-        params = {"text": text}
-
+        # character 和 emotion 在实例生命周期内不变，预先编码为查询参数
+        self.query_suffix = ""
         if self.character:
-            params["character"] = self.character
+            self.query_suffix += f"&character={urllib.parse.quote(str(self.character))}"
         if self.emotion:
-            params["emotion"] = self.emotion
-
-        query_parts = []
-        for key, value in params.items():
-            encoded_value = urllib.parse.quote(str(value))
-            query_parts.append(f"{key}={encoded_value}")
+            self.query_suffix += f"&emotion={urllib.parse.quote(str(self.emotion))}"
+        self.session = aiohttp.ClientSession()
 
-        url = f"{self.api_base}/tts?{'&'.join(query_parts)}"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    with open(path, "wb") as f:
-                        f.write(await response.read())
-                else:
-                    error_text = await response.text()
-                    raise Exception(
-                        f"GSVI TTS API 请求失败，状态码: {response.status}，错误: {error_text}"
-                    )
+    async def get_audio(self, text: str) -> str:
+        temp_dir = os.path.join(get_astrbot_data_path(), "temp")
+        path = os.path.join(temp_dir, f"gsvi_tts_{uuid.uuid4().hex}.wav")
+        url = f"{self.tts_url}?text={urllib.parse.quote(text)}{self.query_suffix}"
+
+        async with self.session.get(url) as response:
+            if response.status == 200:
+                with open(path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        f.write(chunk)
+            else:
+                error_text = await response.text()
+                raise Exception(
+                    f"GSVI TTS API 请求失败，状态码: {response.status}，错误: {error_text}"
+                )
 
         return path
+
+    async def terminate(self):
+        await self.session.close()
@@ -34,11 +34,11 @@ class ProviderOpenAITTSAPI(TTSProvider):
 
     async def get_audio(self, text: str) -> str:
         temp_dir = os.path.join(get_astrbot_data_path(), "temp")
-        path = os.path.join(temp_dir, f"openai_tts_api_{uuid.uuid4()}.wav")
+        path = os.path.join(temp_dir, f"openai_tts_api_{uuid.uuid4().hex}.wav")
         async with self.client.audio.speech.with_streaming_response.create(
             model=self.model_name, voice=self.voice, response_format="wav", input=text
         ) as response:
             with open(path, "wb") as f:
-                async for chunk in response.iter_bytes(chunk_size=1024):
+                async for chunk in response.iter_bytes(chunk_size=64 * 1024):
                     f.write(chunk)
         return path